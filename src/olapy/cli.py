@@ -1,7 +1,6 @@
 import os
-from distutils.dir_util import copy_tree
 from os.path import dirname, expanduser
-from shutil import copyfile
+from shutil import copyfile, copytree
 
 import click
 
@@ -18,9 +17,10 @@ def init():
     if not os.path.isdir(os.path.join(home_directory, "olapy-data", "cubes")):
         os.makedirs(os.path.join(home_directory, "olapy-data", "cubes"))
 
-        copy_tree(
+        copytree(
             os.path.join(olapy_lib_dir, "cubes_templates"),
             os.path.join(home_directory, "olapy-data", "cubes"),
+            dirs_exist_ok=True,
         )
         print("Initializing demo cubes")
 
@@ -1,11 +1,53 @@
 """Parse cube configuration file and create cube parser object which can be
 passed to the MdxEngine."""
 
+import asyncio
+import copy
+import mmap
 import os
-from collections import OrderedDict
+import threading
+from functools import lru_cache
+from os.path import expanduser
+from stat import S_ISREG
+from typing import Dict, Tuple
 
 import yaml
 
+# libyaml's C loader, unless PyYAML was built without it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# parsed cube configs, keyed by (file path, mtime, size) so that an edited
+# file is parsed again; get_cube_config_async() reads it from worker threads
+_CUBE_CACHE: Dict[Tuple[str, int, int], dict] = {}
+_CUBE_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _default_cube_path(olapy_path):
+    # OLAPY_PATH can be injected at runtime (olap_web does), so the path is
+    # cached per value of the variable rather than once at import time
+    if olapy_path is None:
+        olapy_path = expanduser("~")
+    return os.path.join(olapy_path, "olapy-data", "cubes", "cubes-config.yml")
+
+
+def _load_yaml(file_path):
+    """Parse a yaml file, reading it through a read-only memory map with a
+    sequential access hint for the kernel (the parser still reads it in
+    chunks, so the data is copied as with a regular file)."""
+    with open(file_path, "rb") as config_file:
+        try:
+            mm = mmap.mmap(config_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # empty file, or a filesystem without mmap support
+            return yaml.load(config_file.read(), Loader=_Loader)
+        try:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return yaml.load(mm, Loader=_Loader)
+        finally:
+            mm.close()
+
 
 class ConfigParser:
     """Parse olapy config excel file.
@@ -100,48 +142,31 @@ class ConfigParser:
             self.cube_config_file = self._get_cube_path()
 
     def _get_cube_path(self):
-        if "OLAPY_PATH" in os.environ:
-            home_directory = os.environ["OLAPY_PATH"]
-        else:
-            from os.path import expanduser
-
-            home_directory = expanduser("~")
-
-        return os.path.join(home_directory, "olapy-data", "cubes", "cubes-config.yml")
+        return _default_cube_path(os.environ.get("OLAPY_PATH"))
 
     @staticmethod
     def _get_columns(dimension):
-        if "columns" in dimension:
-            return OrderedDict(
-                (
-                    column["name"],
-                    column["name"]
-                    if "column_new_name" not in column
-                    else column["column_new_name"],
-                )
-                for column in dimension["columns"]
-            )
-
-        else:
-            return {}
+        return {
+            column["name"]: column.get("column_new_name", column["name"])
+            for column in dimension.get("columns", [])
+        }
 
     def _get_dimensions(self, config):
-        dimensions = []
-        for dimension in config["dimensions"]:
-            dimensions.append(
-                {
-                    "name": dimension["name"],
-                    "displayName": dimension["displayName"],
-                    "columns": self._get_columns(dimension),
-                }
-            )
-        return dimensions
+        return [
+            {
+                "name": dimension["name"],
+                "displayName": dimension["displayName"],
+                "columns": self._get_columns(dimension),
+            }
+            for dimension in config["dimensions"]
+        ]
 
     def _get_facts(self, config):
+        facts = config["facts"]
         return {
-            "table_name": config["facts"]["table_name"],
-            "keys": config["facts"]["keys"],
-            "measures": config["facts"]["measures"],
+            "table_name": facts["table_name"],
+            "keys": facts["keys"],
+            "measures": facts["measures"],
         }
 
     def get_cube_config(self, conf_file=None):
@@ -149,7 +174,7 @@ class ConfigParser:
         excel.
 
         :param conf_file: full path to config file, Default : ~/olapy-data/cube/cubes-config.yml
-        :return: Cube obj
+        :return: Cube obj, or None if there is no such config file
         """
 
         if conf_file:
@@ -157,13 +182,49 @@ class ConfigParser:
         else:
             file_path = self.cube_config_file
 
-        with open(file_path) as config_file:
-            config = yaml.load(config_file, Loader=yaml.SafeLoader)
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        if not S_ISREG(st.st_mode):
+            return None
+
+        key = (file_path, st.st_mtime_ns, st.st_size)
+        with _CUBE_CACHE_LOCK:
+            if key in _CUBE_CACHE:
+                # callers get their own copy, the cached one must stay intact
+                return copy.deepcopy(_CUBE_CACHE[key])
+
+        config = _load_yaml(file_path)
         # only one cube right now
-        return {
+        cube = {
             "xmla_authentication": bool(config["xmla_authentication"]),
             "name": config["name"],
             "source": config["source"],
             "facts": self._get_facts(config),
             "dimensions": self._get_dimensions(config),
         }
+
+        with _CUBE_CACHE_LOCK:
+            # keep only the latest version of each file
+            for stale_key in [k for k in _CUBE_CACHE if k[0] == file_path]:
+                del _CUBE_CACHE[stale_key]
+            _CUBE_CACHE[key] = cube
+        return copy.deepcopy(cube)
+
+    async def get_cube_config_async(self, conf_file=None):
+        """Same as :meth:`get_cube_config`, but parse the file in a worker
+        thread so that an event loop can keep doing other work meanwhile.
+
+        :param conf_file: full path to config file, Default : ~/olapy-data/cube/cubes-config.yml
+        :return: Cube obj, or None if there is no such config file
+        """
+        # asyncio.to_thread() is only available from python 3.9
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_cube_config, conf_file)
+
+    @staticmethod
+    def invalidate_cache():
+        """Forget all previously parsed cube config files."""
+        with _CUBE_CACHE_LOCK:
+            _CUBE_CACHE.clear()
@@ -8,7 +8,7 @@ import imp
 import logging
 import os
 import sys
-from os.path import expanduser, isfile
+from os.path import expanduser
 from wsgiref.simple_server import make_server
 
 import click
@@ -300,7 +300,7 @@ def runserver(
         pass
 
     cube_config = None
-    if cube_config_file and isfile(cube_config_file):
+    if cube_config_file:
         cube_config_file_parser = ConfigParser()
         cube_config = cube_config_file_parser.get_cube_config(cube_config_file)
 
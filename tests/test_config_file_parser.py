@@ -0,0 +1,107 @@
+import asyncio
+import os
+import shutil
+
+from pytest import fixture
+
+from olapy.core.mdx.tools import config_file_parser
+from olapy.core.mdx.tools.config_file_parser import ConfigParser
+
+TEMPLATE = os.path.join(
+    os.path.dirname(__file__), "..", "cubes_templates", "cubes-config.yml"
+)
+
+
+@fixture
+def config_file(tmp_path):
+    path = str(tmp_path / "cubes-config.yml")
+    shutil.copyfile(TEMPLATE, path)
+    yield path
+    ConfigParser.invalidate_cache()
+
+
+def test_get_cube_config(config_file):
+    cube = ConfigParser(config_file).get_cube_config()
+    assert cube["name"] == "foodmart_with_config"
+    assert cube["source"] == "csv"
+    assert cube["xmla_authentication"] is False
+    assert cube["facts"]["table_name"] == "food_facts"
+    assert cube["facts"]["keys"] == {
+        "product_id": "Product.id",
+        "warehouse_id": "Warehouse.id",
+        "store_id": "Store.id",
+    }
+    assert cube["dimensions"][0]["columns"] == {}
+    assert cube["dimensions"][1]["columns"]["SKU"] == "Stock_keeping_unit"
+    assert list(cube["dimensions"][2]["columns"]) == [
+        "id",
+        "store_type",
+        "store_name",
+        "store_city",
+        "store_country",
+    ]
+
+
+def test_get_cube_config_cache(config_file, monkeypatch):
+    loads = []
+    load_yaml = config_file_parser._load_yaml
+    monkeypatch.setattr(
+        config_file_parser,
+        "_load_yaml",
+        lambda path: loads.append(path) or load_yaml(path),
+    )
+
+    parser = ConfigParser(config_file)
+    cube = parser.get_cube_config()
+    assert parser.get_cube_config() == cube
+    assert len(loads) == 1
+
+    with open(config_file) as f:
+        content = f.read()
+    with open(config_file, "w") as f:
+        f.write(content.replace("foodmart_with_config", "edited_cube"))
+    assert parser.get_cube_config()["name"] == "edited_cube"
+    assert len(loads) == 2
+
+
+def test_get_cube_config_returns_copy(config_file):
+    parser = ConfigParser(config_file)
+    cube = parser.get_cube_config()
+    cube["name"] = "changed"
+    cube["facts"]["measures"].append("changed")
+    cube["dimensions"][1]["columns"]["changed"] = "changed"
+
+    cube = parser.get_cube_config()
+    assert cube["name"] == "foodmart_with_config"
+    assert "changed" not in cube["facts"]["measures"]
+    assert "changed" not in cube["dimensions"][1]["columns"]
+
+
+def test_get_cube_config_missing_file(tmp_path):
+    parser = ConfigParser(str(tmp_path / "cubes-config.yml"))
+    assert parser.get_cube_config() is None
+    assert parser.get_cube_config(str(tmp_path)) is None
+
+
+def test_get_cube_config_async(config_file):
+    parser = ConfigParser(config_file)
+    cube = asyncio.run(parser.get_cube_config_async())
+    assert cube == parser.get_cube_config()
+
+
+def test_get_cube_config_async_concurrent(config_file, tmp_path):
+    paths = []
+    for i in range(8):
+        path = str(tmp_path / f"cubes-config-{i}.yml")
+        shutil.copyfile(config_file, path)
+        paths.append(path)
+
+    async def load_all():
+        parser = ConfigParser()
+        return await asyncio.gather(
+            *(parser.get_cube_config_async(path) for path in paths * 4)
+        )
+
+    cubes = asyncio.run(load_all())
+    assert all(cube == cubes[0] for cube in cubes)
+    assert cubes[0]["name"] == "foodmart_with_config"